@@ -12,19 +12,27 @@ class Settings:
     GOOGLE_API_KEY =  os.getenv("GOOGLE_API_KEY", "")
     LLM_MODEL = os.getenv("LLM_MODEL", "")
     EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "")
+
+    # Local ONNX embeddings for offline/bulk indexing (no API calls)
+    USE_LOCAL_EMBEDDINGS = os.getenv("USE_LOCAL_EMBEDDINGS", "").lower() in ("1", "true", "yes")
+    LOCAL_EMBEDDING_MODEL = os.getenv("LOCAL_EMBEDDING_MODEL", "BAAI/bge-small-en-v1.5")
     
-    CHUNK_SIZE: int = os.getenv("CHUNK_SIZE")
-    CHUNK_OVERLAP: int = os.getenv("CHUNK_OVERLAP")
-    TOP_K: int = os.getenv("TOP_K")
-    TEMPERATURE: float = os.getenv("TEMPERATURE")
-    COLLECTION_NAME = os.getenv("COLLECTION_NAME")
-    VECTOR_STORE_PATH = os.getenv("VECTOR_STORE_PATH")
+    # Converted once at import time so every consumer gets typed values
+    # instead of re-parsing environment strings
+    CHUNK_SIZE: int = int(os.getenv("CHUNK_SIZE", "1000"))
+    CHUNK_OVERLAP: int = int(os.getenv("CHUNK_OVERLAP", "200"))
+    TOP_K: int = int(os.getenv("TOP_K", "5"))
+    TEMPERATURE: float = float(os.getenv("TEMPERATURE", "0.1"))
+    COLLECTION_NAME = os.getenv("COLLECTION_NAME", "financial_documents")
+    VECTOR_STORE_PATH = os.getenv("VECTOR_STORE_PATH", "data/vector_store")
         
     @classmethod
     def get_summary(cls):
         """Get configuration summary"""
         return {
             'EMBEDDING_MODEL': cls.EMBEDDING_MODEL,
+            'USE_LOCAL_EMBEDDINGS': cls.USE_LOCAL_EMBEDDINGS,
+            'LOCAL_EMBEDDING_MODEL': cls.LOCAL_EMBEDDING_MODEL,
             'GOOGLE_API_KEY': cls.GOOGLE_API_KEY,
             'LLM_MODEL': cls.LLM_MODEL,
             'CHUNK_SIZE': cls.CHUNK_SIZE,
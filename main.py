@@ -12,17 +12,20 @@ def main():
     
     ## Load documents from directory
     loader = DocumentLoader(directory_path="data/inputs")
-    documents = loader.load_all_documents()
-    
+
     processor = TextProcessor()
-    chunks = processor.split_documents(documents)
-        
+
     # Step 2: Create embeddings and store in vector database
     print("\n🔮 Creating embeddings and storing in vector database...")
     vector_store = VectorStoreManager()
-    
-    # Add documents to vector store
-    doc_ids = vector_store.add_documents(documents)
+
+    # Stream load -> split -> embed -> insert in bounded batches, so peak
+    # memory stays at one batch instead of the whole corpus
+    chunk_embedding_pairs = processor.split_and_embed(
+        loader.iter_documents(),
+        vector_store.embedding_manager
+    )
+    doc_ids = vector_store.add_stream(chunk_embedding_pairs)
     
     # Step 3: Display collection statistics
     stats = vector_store.get_collection_stats()
@@ -1,35 +1,94 @@
-from typing import List
+from functools import lru_cache
+from typing import Dict, List
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
+from langchain.embeddings import CacheBackedEmbeddings
+from langchain.storage import LocalFileStore
 from langchain.schema import Document
 
 from config.settings import Settings
 
+EMBEDDING_CACHE_PATH = ".cache/embeddings/"
+
+# Embedding models by name, so the cached query helper below can look up
+# the right model without holding it in its cache key.
+_embedding_models: Dict[str, object] = {}
+
+
+@lru_cache(maxsize=1024)
+def _embed_query(model_id: str, query: str) -> List[float]:
+    """Embed a query, caching results per (model, query) pair"""
+    return _embedding_models[model_id].embed_query(query)
+
 
 class EmbeddingCreator:
+
+    # Maximum texts per embed_documents call; the Google embedding API caps
+    # batch size per request, and batching amortizes HTTP overhead.
+    BATCH_SIZE = 100
+
     def __init__(self):
-        
+
         print("Initializing Embedding Creator...")
-        
+
         self.settings = Settings.get_summary()
-        self.embedding_model = GoogleGenerativeAIEmbeddings(
+        underlying_model, self.model_id = self._build_underlying_model()
+
+        # Cache document embeddings on disk so re-indexing unchanged chunks
+        # never hits the API again. Namespaced by model name so switching
+        # embedding models does not reuse stale vectors.
+        store = LocalFileStore(EMBEDDING_CACHE_PATH)
+        self.embedding_model = CacheBackedEmbeddings.from_bytes_store(
+            underlying_model,
+            store,
+            namespace=self.model_id
+        )
+
+        _embedding_models[self.model_id] = self.embedding_model
+
+        print("Embedding Creator initialized...")
+
+    def _build_underlying_model(self):
+        """Build the raw embedding model and its id used for cache namespacing"""
+        if self.settings['USE_LOCAL_EMBEDDINGS']:
+            try:
+                from langchain_community.embeddings import FastEmbedEmbeddings
+
+                model_name = self.settings['LOCAL_EMBEDDING_MODEL']
+                print(f"Using local ONNX embedding model: {model_name}")
+                return FastEmbedEmbeddings(model_name=model_name), model_name
+            except ImportError:
+                print("✗ fastembed not installed, falling back to Google embeddings")
+
+        model = GoogleGenerativeAIEmbeddings(
             model=self.settings['EMBEDDING_MODEL'],
             google_api_key=self.settings['GOOGLE_API_KEY']
         )
-        
-        print("Embedding Creator initialized...")
-        
-    def get_embeddings(self) -> GoogleGenerativeAIEmbeddings:
+        return model, self.settings['EMBEDDING_MODEL']
+
+    def get_embeddings(self) -> CacheBackedEmbeddings:
         """Get the embeddings instance"""
         return self.embedding_model
         
         
     def generate_embeddings_for_documents(self, documents: List[Document]) -> List[List[float]]:
-        """Generate embeddings for a list of documents"""
+        """Generate embeddings for a list of documents in provider-sized batches"""
         texts = [doc.page_content for doc in documents]
-        return self.embedding_model.embed_documents(texts)
+
+        # Embed each distinct text once; repeated boilerplate chunks reuse
+        # the same vector instead of costing extra API calls
+        unique_texts = list(dict.fromkeys(texts))
+        if len(unique_texts) < len(texts):
+            print(f"✓ Embedding {len(unique_texts)} unique texts out of {len(texts)}")
+
+        embeddings = []
+        for i in range(0, len(unique_texts), self.BATCH_SIZE):
+            embeddings.extend(self.embedding_model.embed_documents(unique_texts[i:i + self.BATCH_SIZE]))
+
+        by_text = dict(zip(unique_texts, embeddings))
+        return [by_text[text] for text in texts]
     
     def generate_embedding_for_query(self, query: str) -> List[float]:
-        """Generate embedding for a single query"""
-        embeddings = self.embedding_model.embed_query(query)
+        """Generate embedding for a single query, reusing cached results for repeats"""
+        embeddings = _embed_query(self.model_id, query)
         print("create a embedding of length:", len(embeddings))
         return embeddings
\ No newline at end of file
@@ -1,10 +1,31 @@
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.schema import Document
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, List, Dict, Any, Optional
 from config.settings import Settings
+from utils.vector_store_manager import quantize_embedding, dequantize_embedding
 
 
 class QueryEngine:
+
+    # Cached answers are reused when a new question's embedding is this
+    # similar (cosine) to a previously answered one
+    CACHE_SIMILARITY_THRESHOLD = 0.95
+    # Cached entries older than this are evicted (seconds)
+    CACHE_TTL = 3600
+    # Questions processed concurrently in query_batch; retrieval and LLM
+    # calls are network-bound so threads overlap well
+    MAX_WORKERS = 4
+    # Character budget for retrieved context in the prompt; retrieval is
+    # ranked, so lower-ranked chunks are dropped first when over budget
+    MAX_CONTEXT_CHARS = 12000
+
     def __init__(self, vector_store):
         print("Initializing Advanced Query Engine...")
         settings = Settings.get_summary()
@@ -16,34 +37,147 @@ class QueryEngine:
         )
         self.vector_store = vector_store
 
+        # Semantic cache: embeddings of past questions plus their answers,
+        # so near-duplicate questions skip retrieval and the LLM entirely
+        self.cache_path = os.path.join(settings["VECTOR_STORE_PATH"], "semantic_cache.pkl")
+        # Cached embeddings only compare against vectors from the same
+        # model; a persisted cache from another model is discarded on load
+        self._model_id = vector_store.embedding_manager.model_id
+        self._cache_embeddings: List[List[float]] = []
+        self._cache_entries: List[Dict[str, Any]] = []
+        # query_batch runs query() on several threads; every read or write
+        # of the two cache lists and the pickle goes through this lock
+        self._cache_lock = threading.Lock()
+        self._load_semantic_cache()
+
     def query(self, question: str, k: int = 5) -> Tuple[str, List[Document]]:
         """Manual RAG implementation with more control."""
         print(f"🔍 Processing query: {question}")
-        
-        # Step 1: Retrieve relevant documents
-        retrieved_docs = self.vector_store.similarity_search(question, k=k)
-        
+
+        # Step 0: Check the semantic cache for a near-duplicate question
+        q_embedding = self.vector_store.embedding_manager.generate_embedding_for_query(question)
+        cached = self._check_semantic_cache(q_embedding)
+        if cached is not None:
+            print("✓ Semantic cache hit, returning cached answer")
+            return cached['answer'], cached['sources']
+
+        # Step 1: Retrieve relevant documents, reusing the embedding we
+        # already computed for the cache check instead of embedding again
+        retrieved_docs = self.vector_store.similarity_search_by_vector(q_embedding, k=k)
+
         if not retrieved_docs:
             return "No relevant documents found to answer your question.", []
-        
+
         # Step 2: Build context
         context = self._build_context(retrieved_docs)
-        
+
         # Step 3: Generate prompt
         prompt = self._create_prompt(question, context)
-        
+
         # Step 4: Get LLM response
         response = self.llm.invoke(prompt)
         answer = response.content
-        
+
+        self._add_to_semantic_cache(q_embedding, answer, retrieved_docs)
+
         return answer, retrieved_docs
 
+    def query_batch(self, questions: List[str], k: int = 5) -> List[Tuple[str, List[Document]]]:
+        """Answer several questions concurrently, overlapping their network calls."""
+        if not questions:
+            return []
+
+        print(f"🔍 Processing {len(questions)} queries concurrently")
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            return list(executor.map(lambda q: self.query(q, k=k), questions))
+
+    def _check_semantic_cache(self, q_embedding: List[float]) -> Optional[Dict[str, Any]]:
+        """Return the cached entry closest to the query embedding, if close enough."""
+        with self._cache_lock:
+            self._evict_expired_entries()
+
+            if not self._cache_entries:
+                return None
+
+            cache_mat = np.asarray(self._cache_embeddings, dtype=np.float32)
+            q_vec = np.asarray(q_embedding, dtype=np.float32)
+
+            norms = np.linalg.norm(cache_mat, axis=1) * np.linalg.norm(q_vec)
+            similarities = (cache_mat @ q_vec) / np.where(norms == 0, 1, norms)
+
+            best = int(np.argmax(similarities))
+            if similarities[best] > self.CACHE_SIMILARITY_THRESHOLD:
+                return self._cache_entries[best]
+            return None
+
+    def _add_to_semantic_cache(self, q_embedding: List[float], answer: str, sources: List[Document]):
+        """Store an answered question in the semantic cache and persist it."""
+        with self._cache_lock:
+            self._cache_embeddings.append(list(q_embedding))
+            self._cache_entries.append({
+                'answer': answer,
+                'sources': sources,
+                'timestamp': time.time()
+            })
+            self._save_semantic_cache()
+
+    def _evict_expired_entries(self):
+        """Drop cached entries older than CACHE_TTL."""
+        cutoff = time.time() - self.CACHE_TTL
+        keep = [i for i, entry in enumerate(self._cache_entries) if entry['timestamp'] >= cutoff]
+
+        if len(keep) != len(self._cache_entries):
+            self._cache_embeddings = [self._cache_embeddings[i] for i in keep]
+            self._cache_entries = [self._cache_entries[i] for i in keep]
+
+    def _load_semantic_cache(self):
+        """Load the persisted semantic cache, if present."""
+        try:
+            with open(self.cache_path, 'rb') as f:
+                cached = pickle.load(f)
+            if cached.get('model_id') != self._model_id:
+                print("✗ Semantic cache was built with a different embedding model, discarding it")
+                return
+            with self._cache_lock:
+                self._cache_embeddings = [
+                    dequantize_embedding(quantized, scale)
+                    for quantized, scale in cached['embeddings']
+                ]
+                self._cache_entries = cached['entries']
+                self._evict_expired_entries()
+            print(f"✓ Loaded semantic cache with {len(self._cache_entries)} entries")
+        except (FileNotFoundError, EOFError, KeyError, pickle.UnpicklingError):
+            self._cache_embeddings = []
+            self._cache_entries = []
+
+    def _save_semantic_cache(self):
+        """Persist the semantic cache next to the vector store."""
+        try:
+            with open(self.cache_path, 'wb') as f:
+                pickle.dump({
+                    'model_id': self._model_id,
+                    # int8 quantization keeps the persisted cache ~4x smaller
+                    'embeddings': [quantize_embedding(emb) for emb in self._cache_embeddings],
+                    'entries': self._cache_entries
+                }, f)
+        except OSError as e:
+            print(f"✗ Could not persist semantic cache: {str(e)}")
+
     def _build_context(self, documents: List[Document]) -> str:
-        """Build context string from documents."""
+        """Build context string from documents, capped at MAX_CONTEXT_CHARS."""
         context_parts = []
+        remaining = self.MAX_CONTEXT_CHARS
         for i, doc in enumerate(documents, 1):
             source = doc.metadata.get('source_file', doc.metadata.get('file_name', f'Document {i}'))
-            context_parts.append(f"[Source: {source}]\n{doc.page_content}")
+            part = f"[Source: {source}]\n{doc.page_content}"
+            if len(part) > remaining:
+                if not context_parts:
+                    # A single oversized chunk still has to yield some context
+                    context_parts.append(part[:remaining])
+                print(f"✂ Context budget reached, using {len(context_parts)} of {len(documents)} retrieved chunks")
+                break
+            context_parts.append(part)
+            remaining -= len(part)
         return "\n\n".join(context_parts)
 
     def _create_prompt(self, question: str, context: str) -> str:
@@ -10,31 +10,51 @@ Text Processor Module
 Handles document chunking using LangChain text splitters
 """
 
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
 from langchain.schema import Document
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 from config.settings import Settings
 
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
 
 class TextProcessor:
     """Processes and chunks documents for embedding"""
     
     def __init__(
         self,
-        separators: Optional[List[str]] = None
+        separators: Optional[List[str]] = None,
+        use_sliding_window: bool = False
     ):
         print("Initializing TextProcessor...")
         self.settings = Settings.get_summary()
         self.chunk_size=int(self.settings['CHUNK_SIZE'])
         self.chunk_overlap=int(self.settings['CHUNK_OVERLAP'])
+        self.use_sliding_window = use_sliding_window
         
         if separators is None:
             separators = ["\n\n", "\n", " ", ""]
-        
+
+        # Measure chunk length in tokens when a tokenizer is available, so
+        # CHUNK_SIZE tracks what the embedding model actually consumes
+        # instead of raw character counts
+        if tiktoken is not None:
+            encoding = tiktoken.get_encoding("cl100k_base")
+            length_function = lambda text: len(encoding.encode(text))
+            self.length_unit = "tokens"
+            print("Using token-based chunk sizing (cl100k_base)")
+        else:
+            length_function = len
+            self.length_unit = "characters"
+            print("tiktoken not installed, falling back to character-based chunk sizing")
+
         self.text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=self.chunk_size,
             chunk_overlap=self.chunk_overlap,
-            length_function=len,
+            length_function=length_function,
             separators=separators,
             is_separator_regex=False
         )
@@ -47,12 +67,14 @@ class TextProcessor:
         
         print(f"\n{'='*50}")
         print(f"Chunking {len(documents)} documents")
-        print(f"Chunk size: {self.chunk_size} characters")
-        print(f"Chunk overlap: {self.chunk_overlap} characters")
+        print(f"Chunk size: {self.chunk_size} {self.length_unit}")
+        print(f"Chunk overlap: {self.chunk_overlap} {self.length_unit}")
         print(f"{'='*50}\n")
         
-        chunks = self.text_splitter.split_documents(documents)
-        
+        chunks = []
+        for doc in documents:
+            chunks.extend(self._split_single_document(doc))
+
         print(f"✓ Created {len(chunks)} chunks from {len(documents)} documents")
         print(f"Average chunks per document: {len(chunks) / len(documents):.2f}\n")
         
@@ -75,6 +97,69 @@ class TextProcessor:
             print(f"├─ Source: {source_file}")
             print(f"└─ {'─'*45}\n")
     
+    def _split_single_document(self, document: Document) -> List[Document]:
+        """Chunk one document with the configured strategy (recursive or sliding window)"""
+        if self.use_sliding_window:
+            return [
+                Document(page_content=piece, metadata=dict(document.metadata))
+                for piece in self.sliding_window_split_text(document.page_content)
+            ]
+        return self.text_splitter.split_documents([document])
+
+    def split_and_embed(
+        self,
+        documents: Iterable[Document],
+        embedder,
+        batch_size: int = 100
+    ) -> Iterator[Tuple[Document, List[float]]]:
+        """
+        Split and embed documents in one streaming pass
+
+        Chunks each document as it arrives and flushes a batch to the
+        embedder whenever batch_size chunks are ready, so embedding
+        overlaps with splitting and the full chunk list never has to sit
+        in memory. Pairs well with DocumentLoader.iter_documents.
+
+        Args:
+            documents: Iterable of documents (list or generator)
+            embedder: EmbeddingCreator used to embed each batch
+            batch_size: Chunks per embedding batch
+
+        Yields:
+            (chunk, embedding) tuples
+        """
+        pending: List[Document] = []
+
+        for doc in documents:
+            pending.extend(self._split_single_document(doc))
+            while len(pending) >= batch_size:
+                batch, pending = pending[:batch_size], pending[batch_size:]
+                yield from zip(batch, embedder.generate_embeddings_for_documents(batch))
+
+        if pending:
+            yield from zip(pending, embedder.generate_embeddings_for_documents(pending))
+
+    def sliding_window_split_text(self, text: str) -> List[str]:
+        """
+        Split text with a fixed-stride sliding window
+
+        Precomputes all window offsets up front and slices directly, with
+        none of the recursive separator scanning the default splitter does.
+        Faster on large corpora at the cost of separator-aware boundaries.
+
+        Args:
+            text: Text string to split
+
+        Returns:
+            List of text chunks
+        """
+        if not text:
+            return []
+
+        stride = max(self.chunk_size - self.chunk_overlap, 1)
+        offsets = range(0, max(len(text) - self.chunk_overlap, 1), stride)
+        return [text[start:start + self.chunk_size] for start in offsets]
+
     def split_text(self, text: str) -> List[str]:
         """
         Split a single text string into chunks
@@ -107,16 +192,25 @@ class TextProcessor:
                 'max_chunk_size': 0
             }
         
-        chunk_sizes = [len(chunk.page_content) for chunk in chunks]
-        
+        # Single pass over the chunks; no intermediate size list
+        total_characters = 0
+        min_size = max_size = len(chunks[0].page_content)
+        for chunk in chunks:
+            size = len(chunk.page_content)
+            total_characters += size
+            if size < min_size:
+                min_size = size
+            if size > max_size:
+                max_size = size
+
         info = {
             'total_chunks': len(chunks),
-            'avg_chunk_size': sum(chunk_sizes) / len(chunk_sizes),
-            'min_chunk_size': min(chunk_sizes),
-            'max_chunk_size': max(chunk_sizes),
-            'total_characters': sum(chunk_sizes)
+            'avg_chunk_size': total_characters / len(chunks),
+            'min_chunk_size': min_size,
+            'max_chunk_size': max_size,
+            'total_characters': total_characters
         }
-        
+
         return info
     
     def preview_chunks(self, chunks: List[Document], num_chunks: int = 3):
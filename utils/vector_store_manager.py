@@ -1,15 +1,53 @@
+import hashlib
 import os
 import chromadb
-from typing import List, Optional
+import numpy as np
+from typing import Iterable, List, Optional, Tuple
 from langchain.schema import Document
 from langchain_chroma import Chroma
 from utils.embedder import EmbeddingCreator
 from config.settings import Settings
 
 
+def quantize_embedding(vector: List[float]) -> Tuple[np.ndarray, float]:
+    """
+    Quantize an embedding to int8 with a per-vector scale, shrinking
+    persisted embeddings ~4x versus float32
+
+    Args:
+        vector: Embedding as a list of floats
+
+    Returns:
+        Tuple of (int8 numpy array, scale to recover floats)
+    """
+    arr = np.asarray(vector, dtype=np.float32)
+    scale = float(np.max(np.abs(arr))) / 127.0 if arr.size else 1.0
+    if scale == 0:
+        scale = 1.0
+    return np.round(arr / scale).astype(np.int8), scale
+
+
+def dequantize_embedding(quantized: np.ndarray, scale: float) -> List[float]:
+    """
+    Recover an approximate float embedding from its int8 form
+
+    Args:
+        quantized: int8 numpy array from quantize_embedding
+        scale: Scale returned alongside it
+
+    Returns:
+        Embedding as a list of floats
+    """
+    return (quantized.astype(np.float32) * scale).tolist()
+
+
 class VectorStoreManager:
     """Manages ChromaDB vector store operations"""
-    
+
+    # Documents per add_documents call; keeps each embedding request and
+    # ChromaDB write a bounded size instead of one huge insert
+    BATCH_SIZE = 100
+
     def __init__(self):
         print("Initializing VectorStoreManager...")
         self.settings = Settings.get_summary()
@@ -18,26 +56,115 @@ class VectorStoreManager:
         os.makedirs(self.vector_store_path, exist_ok=True)
 
         self.embedding_manager = EmbeddingCreator()
+        # One PersistentClient shared by the store and the admin helpers;
+        # reconstructing a client per call reopens the on-disk database
+        self.client = chromadb.PersistentClient(path=self.vector_store_path)
         self.vector_store = Chroma(
-            persist_directory=self.vector_store_path,
+            client=self.client,
             embedding_function=self.embedding_manager.get_embeddings(),
             collection_name=self.collection_name
         )
         print("✓ VectorStoreManager initialized...")
     
+    def _document_id(self, document: Document) -> str:
+        """Deterministic id from document content alone, so identical chunks
+        deduplicate across files (the first occurrence keeps its metadata)"""
+        return hashlib.sha256(document.page_content.encode('utf-8')).hexdigest()
+
     def add_documents(self, documents: List[Document]) -> List[str]:
         """Add documents to vector store and persist"""
         print("Adding documents to vector store...")
-        
-        # Add documents to ChromaDB
-        doc_ids = self.vector_store.add_documents(documents)
-                
-        print(f"✓ Added {len(doc_ids)} documents to vector store")
-        return doc_ids
+
+        # Deterministic ids mean re-running ingestion on the same files
+        # skips documents whose embeddings ChromaDB already persisted
+        ids = [self._document_id(doc) for doc in documents]
+
+        # Drop duplicate chunks within this batch (the id is a content
+        # hash), keeping the first occurrence, so identical boilerplate is
+        # embedded and stored only once
+        unique_docs = {}
+        for doc_id, doc in zip(ids, documents):
+            unique_docs.setdefault(doc_id, doc)
+        if len(unique_docs) < len(documents):
+            print(f"✓ Dropped {len(documents) - len(unique_docs)} duplicate chunks")
+
+        existing = set(self.vector_store.get(ids=list(unique_docs))['ids'])
+        new_pairs = [(doc_id, doc) for doc_id, doc in unique_docs.items() if doc_id not in existing]
+
+        if existing:
+            print(f"✓ Skipping {len(unique_docs) - len(new_pairs)} already-indexed documents")
+
+        # Add new documents to ChromaDB in bounded batches
+        for i in range(0, len(new_pairs), self.BATCH_SIZE):
+            batch = new_pairs[i:i + self.BATCH_SIZE]
+            self.vector_store.add_documents(
+                [doc for _, doc in batch],
+                ids=[doc_id for doc_id, _ in batch]
+            )
+
+        print(f"✓ Added {len(new_pairs)} documents to vector store")
+        return ids
     
+    def add_stream(self, chunk_embedding_pairs: Iterable[Tuple[Document, List[float]]]) -> List[str]:
+        """
+        Stream (document, embedding) pairs into the vector store
+
+        Consumes the generator produced by TextProcessor.split_and_embed,
+        inserting in BATCH_SIZE batches with the precomputed embeddings so
+        nothing is re-embedded and only one batch is in memory at a time.
+        Duplicate and already-indexed documents are skipped as in
+        add_documents.
+
+        Args:
+            chunk_embedding_pairs: Iterable of (document, embedding) tuples
+
+        Returns:
+            List of document ids seen in the stream
+        """
+        print("Streaming documents into vector store...")
+        collection = self.client.get_collection(self.collection_name)
+
+        seen_ids = set()
+        added = 0
+        batch = []
+
+        for doc, embedding in chunk_embedding_pairs:
+            doc_id = self._document_id(doc)
+            if doc_id in seen_ids:
+                continue
+            seen_ids.add(doc_id)
+            batch.append((doc_id, doc, embedding))
+            if len(batch) >= self.BATCH_SIZE:
+                added += self._flush_stream_batch(collection, batch)
+                batch = []
+
+        if batch:
+            added += self._flush_stream_batch(collection, batch)
+
+        print(f"✓ Streamed {added} documents into vector store ({len(seen_ids) - added} already indexed)")
+        return list(seen_ids)
+
+    def _flush_stream_batch(self, collection, batch: List[tuple]) -> int:
+        """Upsert one batch of (id, document, embedding) triples, skipping stored ids"""
+        existing = set(collection.get(ids=[doc_id for doc_id, _, _ in batch])['ids'])
+        new = [item for item in batch if item[0] not in existing]
+
+        if new:
+            collection.upsert(
+                ids=[doc_id for doc_id, _, _ in new],
+                embeddings=[embedding for _, _, embedding in new],
+                documents=[doc.page_content for _, doc, _ in new],
+                metadatas=[doc.metadata for _, doc, _ in new]
+            )
+        return len(new)
+
     def similarity_search(self, query: str, k: int = 4) -> List[Document]:
         """Perform similarity search on the vector store"""
         return self.vector_store.similarity_search(query, k=k)
+
+    def similarity_search_by_vector(self, embedding: List[float], k: int = 4) -> List[Document]:
+        """Perform similarity search with an already-computed query embedding"""
+        return self.vector_store.similarity_search_by_vector(embedding, k=k)
     
     def similarity_search_with_score(self, query: str, k: int = 4) -> List[tuple]:
         """Perform similarity search with scores"""
@@ -45,8 +172,7 @@ class VectorStoreManager:
     
     def get_collection_stats(self) -> dict:
         """Get statistics about the vector store collection"""
-        client = chromadb.PersistentClient(path=self.vector_store_path)
-        collection = client.get_collection(self.collection_name)
+        collection = self.client.get_collection(self.collection_name)
         
         return {
             "count": collection.count(),
@@ -55,6 +181,5 @@ class VectorStoreManager:
     
     def delete_collection(self):
         """Delete the entire collection"""
-        client = chromadb.PersistentClient(path=self.vector_store_path)
-        client.delete_collection(self.collection_name)
+        self.client.delete_collection(self.collection_name)
         print("Collection deleted")
\ No newline at end of file